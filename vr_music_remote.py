@@ -15,16 +15,27 @@ Notes
 """
 
 import asyncio
+import collections
 import ctypes
-import io
-import threading
+import ctypes.wintypes as wintypes
+import hashlib
+import time
 import tkinter as tk
+import tkinter.font as tkfont
 
 from PIL import Image, ImageTk
 from winsdk.windows.media.control import (
     GlobalSystemMediaTransportControlsSessionManager as MediaManager,
 )
-from winsdk.windows.storage.streams import DataReader
+from winsdk.windows.graphics.imaging import (
+    BitmapAlphaMode,
+    BitmapDecoder,
+    BitmapInterpolationMode,
+    BitmapPixelFormat,
+    BitmapTransform,
+    ColorManagementMode,
+    ExifOrientationMode,
+)
 
 
 # ----------------------------- UI CONFIG -----------------------------
@@ -36,17 +47,31 @@ CHIP_BG = "#1e1e1e"
 CHIP_BG_ACTIVE = "#2a2a2a"
 
 ART_SIZE = 86
+ART_CACHE_SIZE = 8  # decoded artwork kept around (tracks of one album share art)
 
 # Marquee (slow, VR-friendly)
 MARQUEE_ENABLED = True
-MARQUEE_WINDOW_CHARS = 36
 MARQUEE_DELAY_MS = 350         # how fast it scrolls
+MARQUEE_STEP_PX = 12           # pixels moved per tick (~one character)
 MARQUEE_START_PAUSE_MS = 3500  # pause before scrolling begins
 MARQUEE_GAP = "   •   "        # spacing between repeats
 
+# Media session updates are event-driven; the watchdog is only a safety net.
+# It re-checks quickly after a change, backing off while things stay idle.
+WATCHDOG_MIN_S = 0.5
+WATCHDOG_S = 5.0
+WATCHDOG_BACKOFF = 1.5
+
+# asyncio runs inside the Tk mainloop. It is stepped quickly while an update
+# is in flight, and otherwise only when its next timer is due - capped so
+# WinRT event callbacks (queued from other threads) are still picked up.
+ASYNC_PUMP_MS = 20
+ASYNC_PUMP_IDLE_MS = 200
+
 
 # ----------------------- SYSTEM MEDIA KEY INPUT ----------------------
 user32 = ctypes.WinDLL("user32", use_last_error=True)
+INPUT_KEYBOARD = 1
 KEYEVENTF_KEYUP = 0x0002
 
 VK_MEDIA_NEXT_TRACK = 0xB0
@@ -57,48 +82,163 @@ VK_VOLUME_DOWN = 0xAE
 VK_VOLUME_UP = 0xAF
 
 
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = (
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", wintypes.WPARAM),
+    )
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = (
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", wintypes.WPARAM),
+    )
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = (
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    )
+
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member; it must be present for sizeof(INPUT)
+    _fields_ = (("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT))
+
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = (("type", wintypes.DWORD), ("u", _INPUTUNION))
+
+
+user32.SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+user32.SendInput.restype = wintypes.UINT
+
+
+def _make_press_pair(vk: int):
+    pair = (INPUT * 2)()
+    for rec, flags in zip(pair, (0, KEYEVENTF_KEYUP)):
+        rec.type = INPUT_KEYBOARD
+        rec.ki.wVk = vk
+        rec.ki.dwFlags = flags
+    return pair
+
+
+# Down + up records, built once per key
+_PRESS_PAIRS = {
+    vk: _make_press_pair(vk)
+    for vk in (
+        VK_MEDIA_NEXT_TRACK,
+        VK_MEDIA_PREV_TRACK,
+        VK_MEDIA_PLAY_PAUSE,
+        VK_VOLUME_MUTE,
+        VK_VOLUME_DOWN,
+        VK_VOLUME_UP,
+    )
+}
+_INPUT_SIZE = ctypes.sizeof(INPUT)
+
+
 def press_vk(vk: int) -> None:
-    """Send a global media key press (down + up)."""
-    user32.keybd_event(vk, 0, 0, 0)
-    user32.keybd_event(vk, 0, KEYEVENTF_KEYUP, 0)
+    """Send a global media key press (down + up) in a single SendInput call."""
+    pair = _PRESS_PAIRS.get(vk)
+    if pair is None:
+        pair = _PRESS_PAIRS[vk] = _make_press_pair(vk)
+    user32.SendInput(2, pair, _INPUT_SIZE)
 
 
 # -------------------- NOW PLAYING + THUMBNAIL ------------------------
-async def get_now_playing_and_art():
+async def get_now_playing(session):
     """
-    Returns (title, artist, img_bytes).
+    Returns (title, artist, thumb) for the given media session.
 
-    img_bytes may be None if artwork is not available.
+    thumb is the session's thumbnail reference (pass it to get_art), or None.
     """
-    mgr = await MediaManager.request_async()
-    session = mgr.get_current_session()
     if not session:
         return ("Nothing playing", "", None)
 
     props = await session.try_get_media_properties_async()
     title = (props.title or "").strip()
     artist = (props.artist or "").strip()
-
-    img_bytes = None
     thumb = getattr(props, "thumbnail", None)
+
+    if not title and not artist:
+        title = "Playing (no metadata)"
+
+    return (title, artist, thumb)
+
+
+_art_transform = None
+
+
+def _get_art_transform():
+    """The decode-to-ART_SIZE transform never changes; build it once."""
+    global _art_transform
+    if _art_transform is None:
+        transform = BitmapTransform()
+        transform.scaled_width = ART_SIZE
+        transform.scaled_height = ART_SIZE
+        transform.interpolation_mode = BitmapInterpolationMode.LINEAR
+        _art_transform = transform
+    return _art_transform
+
+
+def _wrap_art_pixels(raw):
+    """
+    Hash the RGBX pixels and wrap them in a PIL image.
+
+    Cheap: the heavy decode + scale already happened in the WinRT codec.
+    """
+    pixels = memoryview(raw).cast("B")
+    art_key = hashlib.blake2b(pixels, digest_size=8).digest()
+    # BitmapAlphaMode.IGNORE leaves the 4th byte meaningless, so treat it as
+    # padding (RGBX): art stays opaque. Mode == rawmode, so PIL maps the WinRT
+    # buffer as-is: no unpack/copy.
+    img = Image.frombuffer("RGBX", (ART_SIZE, ART_SIZE), pixels, "raw", "RGBX", 0, 1)
+    return (img, art_key)
+
+
+async def get_art(thumb):
+    """
+    Returns (art_img, art_key) for the thumbnail.
+
+    art_img is an ART_SIZE x ART_SIZE opaque (RGBX) PIL image (decoded and scaled by the
+    Windows imaging codecs), or None if artwork is not available. art_key is a
+    short hash of the pixels (None without artwork), used to tell whether the
+    art actually changed.
+    """
     if thumb is not None:
         try:
             stream = await thumb.open_read_async()
-            size = int(stream.size)
-            if size > 0:
-                reader = DataReader(stream)
-                await reader.load_async(size)
-                buf = bytearray(size)
-                reader.read_bytes(buf)
-                img_bytes = bytes(buf)
-                reader.close()
+            try:
+                if int(stream.size) > 0:
+                    # Let the OS codec decode straight to the target size
+                    decoder = await BitmapDecoder.create_async(stream)
+                    provider = await decoder.get_pixel_data_async(
+                        BitmapPixelFormat.RGBA8,  # PIL's RGBX layout
+                        BitmapAlphaMode.IGNORE,
+                        _get_art_transform(),
+                        ExifOrientationMode.IGNORE_EXIF_ORIENTATION,
+                        ColorManagementMode.DO_NOT_COLOR_MANAGE,
+                    )
+                    raw = provider.detach_pixel_data()
+                    return _wrap_art_pixels(raw)
+            finally:
+                stream.close()
         except Exception:
-            img_bytes = None
-
-    if not title and not artist:
-        title = "Playing (no metadata)"
+            pass
 
-    return (title, artist, img_bytes)
+    return (None, None)
 
 
 # ------------------------------ APP UI ------------------------------
@@ -120,27 +260,47 @@ class VRMusicRemote(tk.Tk):
         # Artwork / title state
         self._art_size = ART_SIZE
         self._photo = None
+        self._art_cache = collections.OrderedDict()
 
         # Marquee state
         self._stop = False
         self._marquee_run = ""
-        self._marquee_i = 0
-        self._marquee_job = None
-        self._marquee_pause_job = None
+        self._marquee_text = None     # last line given to _start_marquee
+        self._marquee_view_px = 0     # canvas width the current run was built for
+        self._marquee_x = 0           # current offset of the title text item
+        self._marquee_period_px = 0   # width of one "title + gap" repeat
+        self._marquee_job = None  # start pause and ticks share this one slot
+        self._marquee_next_ms = 0
+        self._last_shown = None
 
         # Build widgets
         self._build_ui()
 
-        # Async updater thread
+        # Media session state (owned by the updater loop)
+        self._mgr = None
+        self._mgr_token = None
+        self._session = None
+        self._session_app_id = None
+        self._props_token = None
+        self._session_changed = True  # re-subscribe on the next pass
+        self._media_changed = asyncio.Event()
+
+        # Async updater, stepped from the Tk mainloop (no extra thread)
         self._loop = asyncio.new_event_loop()
-        self._thread = threading.Thread(target=self._runner, daemon=True)
-        self._thread.start()
+        self._pump_job = None
+        self._updating = False  # updater is mid-pass (not parked on the event)
+        self._update_task = self._loop.create_task(self._update_loop())
+        self._pump()
 
         # Close handling
         self.protocol("WM_DELETE_WINDOW", self.destroy)
         self.bind("<Escape>", lambda e: self.destroy())
 
     def _build_ui(self) -> None:
+        # Resolve fonts once and share them across widgets
+        self._title_font = tkfont.Font(family="Segoe UI", size=18, weight="bold")
+        self._big_font = tkfont.Font(family="Segoe UI Emoji", size=22)
+
         # Header row (art + title)
         header = tk.Frame(self, bg=BG, highlightthickness=0, bd=0)
         header.pack(fill="x", padx=12, pady=(10, 6))
@@ -159,16 +319,22 @@ class VRMusicRemote(tk.Tk):
         title_col = tk.Frame(header, bg=BG, highlightthickness=0, bd=0)
         title_col.pack(side="left", fill="x", expand=True, padx=(12, 0))
 
-        self.now_playing_var = tk.StringVar(value="🎵 (loading...)")
-        title_lbl = tk.Label(
-            title_col,
-            textvariable=self.now_playing_var,
-            fg="white",
-            bg=BG,
-            font=("Segoe UI", 18, "bold"),
+        # Title is a canvas text item: scrolling just moves it (no text
+        # relayout), and the canvas size never depends on the text
+        title_h = self._title_font.metrics("linespace") + 4
+        self._title_y = title_h // 2
+        self.title_canvas = tk.Canvas(
+            title_col, height=title_h, bg=BG, highlightthickness=0, bd=0,
+        )
+        self.title_canvas.pack(fill="x")
+        self.title_canvas.bind("<Configure>", self._on_title_resize)
+        self._title_item = self.title_canvas.create_text(
+            0, self._title_y,
             anchor="w",
+            text="🎵 (loading...)",
+            fill="white",
+            font=self._title_font,
         )
-        title_lbl.pack(fill="x")
 
         # Buttons grid
         btn_frame = tk.Frame(self, bg=BG, highlightthickness=0, bd=0)
@@ -180,14 +346,12 @@ class VRMusicRemote(tk.Tk):
         btn_frame.grid_rowconfigure(0, weight=1, minsize=66)
         btn_frame.grid_rowconfigure(1, weight=1, minsize=66)
 
-        big_font = ("Segoe UI Emoji", 22)
-
         def mkbtn(icon: str, cmd, col: int, row: int) -> None:
             b = tk.Button(
                 btn_frame,
                 text=icon,
                 command=cmd,
-                font=big_font,
+                font=self._big_font,
                 relief="flat",
                 bd=0,
                 highlightthickness=0,
@@ -210,8 +374,39 @@ class VRMusicRemote(tk.Tk):
         mkbtn("🔊", lambda: press_vk(VK_VOLUME_UP), 2, 1)
 
     # -------------------------- MARQUEE --------------------------
+    def _show_title(self, text: str) -> None:
+        # Re-setting identical text still forces Tk to re-measure the item
+        if text == self._last_shown:
+            return
+        self._last_shown = text
+        self.title_canvas.itemconfigure(self._title_item, text=text)
+
+    def _reset_title_x(self) -> None:
+        if self._marquee_x != 0:
+            self.title_canvas.move(self._title_item, -self._marquee_x, 0)
+            self._marquee_x = 0
+
+    def _title_view_px(self) -> int:
+        # Visible width of the title canvas (make sure geometry is settled first)
+        width = self.title_canvas.winfo_width()
+        if width <= 1:
+            self.update_idletasks()
+            width = self.title_canvas.winfo_width()
+        return max(width, 1)
+
+    def _now_ms(self) -> int:
+        # Monotonic: wall-clock steps (NTP, manual changes) can't stall the marquee
+        return int(time.monotonic() * 1000)
+
+    def _on_title_resize(self, event) -> None:
+        # Fit check and run length depend on the canvas width: rebuild on resize
+        if self._marquee_text is not None and event.width != self._marquee_view_px:
+            self._start_marquee(self._marquee_text)
+
     def _start_marquee(self, text: str) -> None:
-        # Cancel any existing jobs
+        self._marquee_text = text
+
+        # Cancel any pending pause/tick
         if self._marquee_job is not None:
             try:
                 self.after_cancel(self._marquee_job)
@@ -219,98 +414,220 @@ class VRMusicRemote(tk.Tk):
                 pass
             self._marquee_job = None
 
-        if self._marquee_pause_job is not None:
-            try:
-                self.after_cancel(self._marquee_pause_job)
-            except Exception:
-                pass
-            self._marquee_pause_job = None
+        self._reset_title_x()
 
         if not MARQUEE_ENABLED:
-            self.now_playing_var.set(text)
+            self._marquee_run = ""
+            self._show_title(text)
             return
 
         t = text.strip()
-        if len(t) <= MARQUEE_WINDOW_CHARS:
-            self.now_playing_var.set(t)
+        view_px = self._marquee_view_px = self._title_view_px()
+        if self._title_font.measure(t) <= view_px:
+            # Fits the canvas: no scrolling, so no ticks get scheduled
+            self._marquee_run = ""
+            self._show_title(t)
             return
 
-        # Show start, pause, then scroll
-        self.now_playing_var.set(t[:MARQUEE_WINDOW_CHARS])
-        self._marquee_run = t + MARQUEE_GAP + t
-        self._marquee_i = 0
-        self._marquee_pause_job = self.after(MARQUEE_START_PAUSE_MS, self._tick_marquee)
+        # Draw the whole run once, pause, then scroll it by moving the item.
+        # Repeat "title + gap" until the run covers the canvas plus one period,
+        # so the window is always full and jumping back by one period is seamless.
+        unit = t + MARQUEE_GAP
+        self._marquee_period_px = self._title_font.measure(unit)
+        copies = -(-view_px // self._marquee_period_px) + 1  # ceil + 1
+        self._marquee_run = unit * copies
+        self._show_title(self._marquee_run)
+        self._marquee_next_ms = self._now_ms() + MARQUEE_START_PAUSE_MS
+        self._marquee_job = self.after(MARQUEE_START_PAUSE_MS, self._tick_marquee)
 
     def _tick_marquee(self) -> None:
         if self._stop or not self._marquee_run:
             return
 
-        n = len(self._marquee_run)
-        i = self._marquee_i % n
-        shown = (self._marquee_run[i : i + MARQUEE_WINDOW_CHARS]).ljust(MARQUEE_WINDOW_CHARS)
-        self.now_playing_var.set(shown)
-
-        self._marquee_i += 1
-        self._marquee_job = self.after(MARQUEE_DELAY_MS, self._tick_marquee)
+        step = -MARQUEE_STEP_PX
+        if self._marquee_x + step <= -self._marquee_period_px:
+            step += self._marquee_period_px
+        self.title_canvas.move(self._title_item, step, 0)
+        self._marquee_x += step
+
+        # Schedule against an absolute timeline so handler time doesn't add drift
+        now = self._now_ms()
+        self._marquee_next_ms += MARQUEE_DELAY_MS
+        if self._marquee_next_ms < now - MARQUEE_DELAY_MS:
+            # Fell far behind (e.g. machine was asleep): resync, don't burst
+            self._marquee_next_ms = now + MARQUEE_DELAY_MS
+        delay = max(0, self._marquee_next_ms - now)
+        self._marquee_job = self.after(delay, self._tick_marquee)
 
     # -------------------------- ASYNC UPDATE --------------------------
-    def _runner(self) -> None:
-        asyncio.set_event_loop(self._loop)
-        self._loop.run_until_complete(self._update_loop())
-
-    def _set_art(self, img_bytes) -> None:
-        if not img_bytes:
-            self.art_label.configure(image="")
-            self._photo = None
+    def _pump(self) -> None:
+        # Run one pass of ready asyncio callbacks, then hand control back to Tk
+        self._loop.call_soon(self._loop.stop)
+        self._loop.run_forever()
+        self._pump_job = self.after(self._next_pump_ms(), self._pump)
+
+    def _next_pump_ms(self) -> int:
+        loop = self._loop
+        if loop._ready:
+            return 1  # callbacks already queued: run them right away
+        if self._updating:
+            return ASYNC_PUMP_MS  # awaiting WinRT results from other threads
+        timers = [h.when() for h in loop._scheduled if not h.cancelled()]
+        if not timers:
+            return ASYNC_PUMP_IDLE_MS
+        due_ms = int((min(timers) - loop.time()) * 1000) + 1
+        return max(1, min(due_ms, ASYNC_PUMP_IDLE_MS))
+
+    def _show_photo(self, photo) -> None:
+        # Skip the Tk configure (and relayout) when the image is unchanged
+        if photo is self._photo:
+            return
+        self._photo = photo
+        self.art_label.configure(image=photo if photo is not None else "")
+
+    def _set_art(self, art_img, key) -> None:
+        if art_img is None:
+            self._show_photo(None)
             return
 
         try:
-            img = Image.open(io.BytesIO(img_bytes)).convert("RGB")
-            img = img.resize((self._art_size, self._art_size), Image.LANCZOS)
-            self._photo = ImageTk.PhotoImage(img)
-            self.art_label.configure(image=self._photo)
+            photo = self._art_cache.get(key)
+            if photo is not None:
+                self._art_cache.move_to_end(key)
+            else:
+                # Decoded + scaled by the WinRT codec; only the Tk image is made here
+                photo = ImageTk.PhotoImage(art_img)
+                self._art_cache[key] = photo
+                if len(self._art_cache) > ART_CACHE_SIZE:
+                    self._art_cache.popitem(last=False)
+
+            self._show_photo(photo)
         except Exception:
-            self.art_label.configure(image="")
-            self._photo = None
+            self._show_photo(None)
+
+    def _on_media_event(self, sender, args) -> None:
+        # WinRT raises these on its own worker threads
+        try:
+            self._loop.call_soon_threadsafe(self._media_changed.set)
+        except RuntimeError:
+            pass  # loop already closed
+
+    def _on_session_changed(self, sender, args) -> None:
+        # CurrentSessionChanged: the new session may come from the same app,
+        # so always re-subscribe rather than comparing app ids
+        try:
+            self._loop.call_soon_threadsafe(self._mark_session_changed)
+        except RuntimeError:
+            pass  # loop already closed
+
+    def _mark_session_changed(self) -> None:
+        self._session_changed = True
+        self._media_changed.set()
+
+    def _drop_manager(self) -> None:
+        self._watch_session(None)
+        self._session_app_id = None
+        self._session_changed = True
+        if self._mgr is not None and self._mgr_token is not None:
+            try:
+                self._mgr.remove_current_session_changed(self._mgr_token)
+            except Exception:
+                pass
+        self._mgr = None
+        self._mgr_token = None
+
+    def _watch_session(self, session) -> None:
+        if self._session is not None and self._props_token is not None:
+            try:
+                self._session.remove_media_properties_changed(self._props_token)
+            except Exception:
+                pass
+        self._session = session
+        self._props_token = None
+        if session is not None:
+            self._props_token = session.add_media_properties_changed(self._on_media_event)
 
     async def _update_loop(self) -> None:
-        last = None
+        last = None  # (title, artist)
+        delay = WATCHDOG_MIN_S
+        woken = False  # True when WinRT signalled a change (vs. watchdog timeout)
         while not self._stop:
+            self._media_changed.clear()
+            self._updating = True
             try:
-                title, artist, img_bytes = await get_now_playing_and_art()
+                if self._mgr is None:
+                    # One COM activation, reused until a read fails
+                    mgr = await MediaManager.request_async()
+                    self._mgr_token = mgr.add_current_session_changed(self._on_session_changed)
+                    self._mgr = mgr  # only once the handler is attached
+
+                session = self._mgr.get_current_session()
+                # The app-id check only backs up a missed CurrentSessionChanged
+                app_id = session.source_app_user_model_id if session is not None else None
+                if self._session_changed or app_id != self._session_app_id:
+                    self._session_changed = False
+                    self._watch_session(session)
+                    self._session_app_id = app_id
+
+                title, artist, thumb = await get_now_playing(session)
                 cur = (title, artist)
 
                 if cur != last:
                     last = cur
+                    delay = WATCHDOG_MIN_S
                     line = f"🎵 {title}" if title else "🎵 (unknown)"
-                    # UI updates must happen on the Tk thread
-                    self.after(0, self._start_marquee, line)
-                    self.after(0, self._set_art, img_bytes)
+                    # Already on the Tk thread (see _pump). The title goes up
+                    # now; artwork follows once WinRT has decoded it.
+                    self._start_marquee(line)
+                    self._set_art(*await get_art(thumb))
+                elif woken:
+                    # Same track but WinRT reported a change: artwork may have
+                    # been updated on its own (e.g. live streams). Identical
+                    # pixels hit the art cache and leave the label untouched.
+                    self._set_art(*await get_art(thumb))
+                else:
+                    # Watchdog tick with nothing new: skip the thumbnail read
+                    delay = min(delay * WATCHDOG_BACKOFF, WATCHDOG_S)
 
             except Exception:
-                self.after(0, self._start_marquee, "🎵 (unable to read media session)")
-                self.after(0, self._set_art, None)
-
-            await asyncio.sleep(0.5)
+                self._start_marquee("🎵 (unable to read media session)")
+                self._set_art(None, None)
+                last = None
+                delay = WATCHDOG_MIN_S
+                # The manager proxy may be dead (e.g. media host restarted):
+                # drop it so the next pass requests and subscribes afresh
+                self._drop_manager()
+
+            # Sleep until WinRT reports a change (or the watchdog fires)
+            self._updating = False
+            try:
+                await asyncio.wait_for(self._media_changed.wait(), delay)
+                woken = True
+            except asyncio.TimeoutError:
+                woken = False
 
     def destroy(self) -> None:
-        # Stop marquee jobs
+        # Stop marquee job
         self._stop = True
         if self._marquee_job is not None:
             try:
                 self.after_cancel(self._marquee_job)
             except Exception:
                 pass
-        if self._marquee_pause_job is not None:
+
+        # Stop pumping and shut the asyncio loop down
+        if self._pump_job is not None:
             try:
-                self.after_cancel(self._marquee_pause_job)
+                self.after_cancel(self._pump_job)
             except Exception:
                 pass
-
-        # Stop asyncio loop thread
         try:
-            if self._loop.is_running():
-                self._loop.call_soon_threadsafe(self._loop.stop)
+            self._update_task.cancel()
+            # Let the cancellation unwind fully (wait_for needs extra passes)
+            self._loop.run_until_complete(
+                asyncio.gather(self._update_task, return_exceptions=True)
+            )
+            self._loop.close()
         except Exception:
             pass
 